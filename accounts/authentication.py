@@ -0,0 +1,87 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+USER_CACHE_TIMEOUT = 300
+
+# Validated tokens are kept for less than the access token lifetime so an
+# expiring token is always re-checked by SimpleJWT.
+TOKEN_CACHE_TIMEOUT = 240
+TOKEN_CACHE_MAXSIZE = 10000
+
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def user_cache_key(user_id):
+    """Cache key for the authenticated user instance, cleared by accounts.signals"""
+    return f'user:{user_id}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches validated tokens and the user lookup
+    between requests, saving the signature check and the user SELECT on
+    every authenticated call. The active and revoked-token checks still
+    run on every request.
+    
+    Users are only cached when ``CACHE_AUTHENTICATED_USERS`` is set, which
+    requires a cache shared by every worker: invalidation on save only
+    reaches the cache of the process that saved the user.
+    """
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        now = time.time()
+
+        with _token_cache_lock:
+            entry = _token_cache.get(key)
+            if entry is not None:
+                token, expires_at = entry
+                if expires_at > now:
+                    _token_cache.move_to_end(key)
+                    return token
+                del _token_cache[key]
+
+        token = super().get_validated_token(raw_token)
+        expires_at = min(now + TOKEN_CACHE_TIMEOUT, token.get('exp', now))
+
+        with _token_cache_lock:
+            _token_cache[key] = (token, expires_at)
+            _token_cache.move_to_end(key)
+            while len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+                _token_cache.popitem(last=False)
+        return token
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None or not settings.CACHE_AUTHENTICATED_USERS:
+            return super().get_user(validated_token)
+
+        cache_key = user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None:
+            try:
+                user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed(_('User not found'), code='user_not_found') from e
+            cache.set(cache_key, user, USER_CACHE_TIMEOUT)
+
+        # Same checks as JWTAuthentication.get_user, run on cached users too
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+        return user
@@ -0,0 +1,14 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id sized for the login/register latency budget.
+    
+    Uses 64 MiB and 4 lanes instead of Django's 100 MiB and 8 lanes. Hashes
+    keep the standard 'argon2' algorithm name, so switching back to Django's
+    default parameters only re-hashes on the next login.
+    """
+    time_cost = 2
+    memory_cost = 65536
+    parallelism = 4
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('admin', 'Admin'), ('customer', 'Customer')], db_index=True, default='customer', max_length=10),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from appifyEcommerce.migration_operations import CreateTrigramIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_user_role'),
+    ]
+
+    operations = [
+        CreateTrigramIndex('user_username_trgm', 'accounts_user', 'username'),
+    ]
@@ -1,20 +1,14 @@
 class AdminRoleMixin:
     """Mixin to restrict admin access to users with role='admin' or superusers."""
     
-    def has_module_permission(self, request):
-        if not request.user.is_authenticated:
-            return False
+    def has_module_permission(self, request, obj=None):
+        user = request.user
         # Allow if superuser or has 'admin' role
-        return request.user.is_superuser or getattr(request.user, 'role', '') == 'admin'
-    
-    def has_view_permission(self, request, obj=None):
-        return self.has_module_permission(request)
-    
-    def has_add_permission(self, request, obj=None):
-        return self.has_module_permission(request)
-    
-    def has_change_permission(self, request, obj=None):
-        return self.has_module_permission(request)
-    
-    def has_delete_permission(self, request, obj=None):
-        return self.has_module_permission(request)
+        return user.is_authenticated and user.is_admin
+    
+    # Every admin permission is the same role check, so share the function
+    # instead of delegating through a second call per check.
+    has_view_permission = has_module_permission
+    has_add_permission = has_module_permission
+    has_change_permission = has_module_permission
+    has_delete_permission = has_module_permission
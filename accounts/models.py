@@ -1,23 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from django.db import models
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser
+from django.utils.functional import cached_property
 
 
 class User(AbstractUser):
-    ROLE_CHOICES = [
-        ('admin', 'Admin'),
-        ('customer', 'Customer'),
-    ]
-    role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='customer')
+    class Role(models.TextChoices):
+        ADMIN = 'admin', 'Admin'
+        CUSTOMER = 'customer', 'Customer'
+
+    ROLE_CHOICES = Role.choices
+    role = models.CharField(max_length=10, choices=Role.choices, default=Role.CUSTOMER, db_index=True)
 
     def __str__(self):
         return self.username
+
+    @classmethod
+    def bulk_register(cls, users_data, batch_size=500, max_workers=4):
+        """
+        Create many users with one INSERT per batch.
+        
+        Passwords are hashed in a small thread pool; argon2-cffi releases the
+        GIL while hashing. Each Argon2 hash allocates its own memory (64 MiB
+        by default), so max_workers also bounds peak memory use.
+        """
+        users_data = list(users_data)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            passwords = list(executor.map(make_password, [data['password'] for data in users_data]))
+
+        users = [
+            cls(
+                username=cls.normalize_username(data['username']),
+                email=cls.objects.normalize_email(data.get('email', '')),
+                role=data.get('role', cls.Role.CUSTOMER),
+                password=password,
+            )
+            for data, password in zip(users_data, passwords)
+        ]
+        return cls.objects.bulk_create(users, batch_size=batch_size)
     
-    @property
+    @cached_property
     def is_admin(self):
         """Check if user is admin"""
-        return self.is_superuser or self.role == 'admin'
+        return self.is_superuser or self.role == self.Role.ADMIN
     
-    @property
+    @cached_property
     def is_customer(self):
         """Check if user is customer"""
-        return self.role == 'customer'
+        return self.role == self.Role.CUSTOMER
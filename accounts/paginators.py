@@ -0,0 +1,29 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Admin paginator that estimates the size of unfiltered changelists.
+
+    On PostgreSQL an unfiltered changelist is counted from the planner's
+    row estimate in pg_class instead of a full COUNT(*). Filtered or
+    searched lists, other databases and tables that have never been
+    analyzed fall back to an exact count.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
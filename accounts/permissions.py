@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from cart.models import Cart
+
 
 class IsAdmin(permissions.BasePermission):
     """
@@ -7,11 +9,8 @@ class IsAdmin(permissions.BasePermission):
     """
     
     def has_permission(self, request, view):
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            (request.user.is_superuser or getattr(request.user, 'role', '') == 'admin')
-        )
+        user = request.user
+        return bool(user and user.is_authenticated and user.is_admin)
 
 
 class IsCustomer(permissions.BasePermission):
@@ -20,16 +19,21 @@ class IsCustomer(permissions.BasePermission):
     """
     
     def has_permission(self, request, view):
-        return (
-            request.user and 
-            request.user.is_authenticated and 
-            getattr(request.user, 'role', '') == 'customer'
-        )
+        user = request.user
+        return bool(user and user.is_authenticated and user.is_customer)
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
     """
     Allows access if user is the owner of the object or an admin.
+
+    Viewsets scope their querysets to the current user, so this only guards
+    single-object access and never walks related objects.
+
+    Ownership is compared on foreign key ids (``obj.user_id``, ``obj.cart_id``)
+    which are already on the instance; comparing related objects such as
+    ``obj.user == request.user`` would load the related row first. New checks
+    should follow the same pattern.
     """
     
     def has_object_permission(self, request, view, obj):
@@ -37,26 +41,40 @@ class IsOwnerOrAdmin(permissions.BasePermission):
             return False
             
         # Admin can access any object
-        if request.user.is_superuser or getattr(request.user, 'role', '') == 'admin':
+        if request.user.is_admin:
             return True
             
         # Check if object has a user field and if it matches the current user
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
+        user_id = getattr(obj, 'user_id', None)
+        if user_id is not None:
+            return user_id == request.user.id
             
-        # For cart objects, check if cart belongs to user
-        if hasattr(obj, 'cart') and hasattr(obj.cart, 'user'):
-            return obj.cart.user == request.user
+        # For cart objects, check the cart id against the user's carts
+        cart_id = getattr(obj, 'cart_id', None)
+        if cart_id is not None:
+            return cart_id in self.get_owned_cart_ids(request)
             
         return False
 
+    @staticmethod
+    def get_owned_cart_ids(request):
+        """Cart ids owned by the current user, loaded once per request"""
+        owned_cart_ids = getattr(request, '_owned_cart_ids', None)
+        if owned_cart_ids is None:
+            owned_cart_ids = frozenset(
+                Cart.objects.filter(user=request.user).values_list('id', flat=True)
+            )
+            request._owned_cart_ids = owned_cart_ids
+        return owned_cart_ids
+
 
 class IsAuthenticatedOrReadOnly(permissions.BasePermission):
     """
     Allows read-only access to unauthenticated users, but requires authentication for write operations.
     """
+    SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
     
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in self.SAFE_METHODS:
             return True
         return request.user and request.user.is_authenticated
@@ -9,7 +9,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, validators=[validate_password])
     password_confirm = serializers.CharField(write_only=True)
     email = serializers.EmailField(required=True)
-    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, default='customer')
+    role = serializers.ChoiceField(choices=User.Role.choices, default=User.Role.CUSTOMER)
 
     class Meta:
         model = User
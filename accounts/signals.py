@@ -0,0 +1,18 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache_key
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Drop the cached user so the next request reloads it.
+    
+    ``QuerySet.update()`` sends no signals; callers updating users that way
+    must delete ``user_cache_key(pk)`` themselves.
+    """
+    cache.delete(user_cache_key(instance.pk))
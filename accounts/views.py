@@ -24,6 +24,20 @@ def get_tokens_for_user(user):
     }
 
 
+def get_user_payload(user):
+    """Build the UserProfileSerializer output without a serializer instance"""
+    date_joined = user.date_joined.isoformat()
+    if date_joined.endswith('+00:00'):
+        date_joined = date_joined[:-6] + 'Z'
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'role': user.role,
+        'date_joined': date_joined,
+    }
+
+
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
 def register(request):
@@ -38,7 +52,7 @@ def register(request):
             'success': True,
             'message': 'User registered successfully',
             'content': {
-                'user': UserProfileSerializer(user).data,
+                'user': get_user_payload(user),
                 'tokens': tokens
             }
         }, status=status.HTTP_201_CREATED)
@@ -66,7 +80,7 @@ def login(request):
             'success': True,
             'message': 'Login successful',
             'data': {
-                'user': UserProfileSerializer(user).data,
+                'user': get_user_payload(user),
                 'tokens': tokens
             }
         }, status=status.HTTP_200_OK)
@@ -1,5 +1,9 @@
+import copy
+
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
 from rest_framework import serializers
 from django.core.exceptions import ValidationError
 
@@ -9,7 +13,26 @@ from orders.models import Order, OrderItem
 
 User = get_user_model()
 
-class ProductSerializer(serializers.ModelSerializer):
+
+class CachedFieldsMixin:
+    """
+    Build ModelSerializer fields once per class and hand out copies.
+    
+    DRF re-introspects the model for every serializer instance; the result
+    only depends on Meta, so it is computed on first use and deep-copied
+    (which rebuilds each field from its constructor arguments) afterwards.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
+
+
+class ProductSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     available_stock = serializers.ReadOnlyField()
 
     class Meta:
@@ -17,7 +40,7 @@ class ProductSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'price', 'stock_quantity', 'available_stock']
 
 
-class CartItemSerializer(serializers.ModelSerializer):
+class CartItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for CartItem model.
     
@@ -85,34 +108,58 @@ class CartItemSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """
-        Create a new cart item with stock reservation.
+        Add a product to the user's cart with stock reservation.
         
-        This method reserves stock for the product when adding items to cart.
-        Uses atomic transaction to ensure data integrity.
+        Stock is reserved with Product.reserve_stock's conditional UPDATE, so
+        the check and the reservation happen atomically in the database.
+        An item already in the cart is incremented with ``F('quantity')``, so
+        concurrent adds of the same product cannot overwrite each other; the
+        cart is only looked up when a new item has to be inserted.
         
         Args:
-            validated_data: Validated cart item data
+            validated_data: Validated cart item data plus the cart's ``user``
             
         Returns:
-            CartItem: Created cart item instance
+            CartItem: Created or incremented cart item instance
+            
+        Raises:
+            ValidationError: If insufficient stock is available
         """
         with transaction.atomic():
+            user = validated_data.pop('user')
             product = validated_data['product']
             quantity = validated_data['quantity']
             
             # Reserve stock
-            product.reserve_stock(quantity)
+            self._reserve_stock(product, quantity)
             
-            # Create cart item
-            cart_item = super().create(validated_data)
+            # Increment the existing item in the database, if there is one;
+            # matching on the cart's user skips loading the cart itself
+            existing_item = CartItem.objects.filter(cart__user=user, product=product)
+            if not self._increment(existing_item, quantity):
+                cart, created = Cart.objects.get_or_create(user=user)
+                try:
+                    with transaction.atomic():
+                        return super().create({**validated_data, 'cart': cart})
+                except IntegrityError:
+                    # A concurrent request inserted the same product first
+                    self._increment(existing_item, quantity)
+            
+            cart_item = existing_item.get()
+            cart_item.product = product
             return cart_item
 
+    @staticmethod
+    def _increment(cart_items, quantity):
+        """Add quantity to the matching cart items with one UPDATE; returns the rows matched"""
+        return cart_items.update(quantity=F('quantity') + quantity, updated_at=timezone.now())
+
     def update(self, instance, validated_data):
         """
         Update cart item quantity with stock adjustment.
         
-        This method handles stock reservation/release when updating quantities.
-        Uses atomic transaction to prevent race conditions.
+        This method handles stock reservation/release when updating quantities
+        using conditional UPDATEs, so concurrent updates cannot oversell.
         
         Args:
             instance: Existing cart item instance
@@ -120,6 +167,9 @@ class CartItemSerializer(serializers.ModelSerializer):
             
         Returns:
             CartItem: Updated cart item instance
+            
+        Raises:
+            ValidationError: If insufficient stock for quantity increase
         """
         with transaction.atomic():
             old_quantity = instance.quantity
@@ -129,19 +179,33 @@ class CartItemSerializer(serializers.ModelSerializer):
             # Calculate quantity difference
             quantity_diff = new_quantity - old_quantity
 
-            if quantity_diff != 0:
-                if quantity_diff > 0:
-                    # Adding more items - reserve additional stock
-                    product.reserve_stock(quantity_diff)
-                else:
-                    # Removing items - release stock
-                    product.release_stock(abs(quantity_diff))
+            if quantity_diff > 0:
+                # Adding more items - reserve additional stock
+                self._reserve_stock(product, quantity_diff)
+            elif quantity_diff < 0:
+                # Removing items - release stock
+                if not Product.try_release(product.pk, -quantity_diff):
+                    raise serializers.ValidationError('Cannot release more stock than reserved.')
+                product.reserved_stock += quantity_diff
 
             # Update cart item
             instance.quantity = new_quantity
-            instance.save()
+            instance.save(update_fields=['quantity', 'updated_at'])
             return instance
 
+    @staticmethod
+    def _reserve_stock(product, quantity):
+        """
+        Reserve stock through Product.reserve_stock, reporting a shortage as a 400.
+        
+        Raises:
+            ValidationError: If insufficient stock is available
+        """
+        try:
+            product.reserve_stock(quantity)
+        except ValidationError as error:
+            raise serializers.ValidationError(error.messages)
+
     def delete(self, instance):
         """
         Delete cart item and release reserved stock.
@@ -158,7 +222,7 @@ class CartItemSerializer(serializers.ModelSerializer):
             super().delete(instance)
 
 
-class CartSerializer(serializers.ModelSerializer):
+class CartSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     items = CartItemSerializer(many=True, read_only=True)
 
     class Meta:
@@ -167,13 +231,13 @@ class CartSerializer(serializers.ModelSerializer):
         read_only_fields = ['user']
 
 
-class OrderItemSerializer(serializers.ModelSerializer):
+class OrderItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = OrderItem
         fields = ['id', 'order', 'product', 'quantity', 'price_at_purchase']
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, read_only=True)
 
     class Meta:
@@ -182,10 +246,52 @@ class OrderSerializer(serializers.ModelSerializer):
         read_only_fields = ['user', 'total_price', 'status', 'created_at', 'items']
 
 
+class ProductIdField(serializers.IntegerField):
+    """
+    Product id left unresolved so PlaceOrderSerializer can check every
+    item's product with one query. Errors match PrimaryKeyRelatedField.
+    """
+    default_error_messages = {
+        'incorrect_type': serializers.PrimaryKeyRelatedField.default_error_messages['incorrect_type'],
+        'does_not_exist': serializers.PrimaryKeyRelatedField.default_error_messages['does_not_exist'],
+    }
+
+    def to_internal_value(self, data):
+        # int() would turn True into 1 and 3.7 into 3
+        if isinstance(data, bool) or (isinstance(data, float) and not data.is_integer()):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+
 class PlaceOrderItemSerializer(serializers.Serializer):
-    product = serializers.PrimaryKeyRelatedField(queryset=Product.objects.all())
+    product = ProductIdField()
     quantity = serializers.IntegerField(min_value=1)
 
 
 class PlaceOrderSerializer(serializers.Serializer):
     items = PlaceOrderItemSerializer(many=True)
+
+    def validate_items(self, items):
+        """
+        Check that every item's product id exists with a single query.
+        
+        Items keep the product id; place_order reads the stock columns
+        when it locks the products.
+        
+        Raises:
+            ValidationError: If any product id does not exist
+        """
+        product_ids = {item['product'] for item in items}
+        existing = set(Product.objects.filter(pk__in=product_ids).values_list('id', flat=True))
+
+        if not product_ids <= existing:
+            message = ProductIdField.default_error_messages['does_not_exist']
+            raise serializers.ValidationError([
+                {} if item['product'] in existing
+                else {'product': [message.format(pk_value=item['product'])]}
+                for item in items
+            ])
+        return items
@@ -3,10 +3,14 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db import transaction
+from django.db.models import Count, Max, Prefetch
 from django.core.exceptions import ValidationError
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 from decimal import Decimal
+import hashlib
 
 from cart.models import Cart, CartItem
 from orders.models import Order, OrderItem
@@ -23,9 +27,24 @@ from .serializers import (
 
 User = get_user_model()
 
+# Columns read by CartItemSerializer; skips Product.description and the
+# cart/user rows, which are only referenced by id.
+CART_ITEM_FIELDS = (
+    'id', 'cart', 'product', 'quantity',
+    'product__name', 'product__price', 'product__stock_quantity', 'product__reserved_stock',
+)
+
+
+def product_list_etag(request, *args, **kwargs):
+    """ETag for the product list; changes whenever a product is added, edited or removed"""
+    version = Product.objects.aggregate(count=Count('id'), updated=Max('updated_at'))
+    return hashlib.md5(f"{version['count']}:{version['updated']}".encode()).hexdigest()
+
 
 class ProductViewSet(viewsets.ModelViewSet):
-    queryset = Product.objects.all()
+    # Newest first; Product has no default ordering, so internal lookups
+    # and aggregates do not pay for a sort
+    queryset = Product.objects.order_by('-id')
     serializer_class = ProductSerializer
     
     def get_permissions(self):
@@ -35,17 +54,25 @@ class ProductViewSet(viewsets.ModelViewSet):
             self.permission_classes = [IsAuthenticatedOrReadOnly]
         return super().get_permissions()
 
+    @method_decorator(condition(etag_func=product_list_etag))
+    def list(self, request, *args, **kwargs):
+        """List products, answering 304 Not Modified when the client's ETag is current"""
+        return super().list(request, *args, **kwargs)
+
 
 class CartViewSet(viewsets.ModelViewSet):
-    queryset = Cart.objects.all()
+    queryset = Cart.objects.prefetch_related(
+        Prefetch('items', queryset=CartItem.objects.select_related('product').only(*CART_ITEM_FIELDS))
+    )
     serializer_class = CartSerializer
     permission_classes = [IsCustomer | IsAdmin]
 
     def get_queryset(self):
         if self.request.user.is_authenticated:
+            queryset = super().get_queryset()
             if self.request.user.is_admin:
-                return Cart.objects.all()
-            return Cart.objects.filter(user=self.request.user)
+                return queryset
+            return queryset.filter(user=self.request.user)
         return Cart.objects.none()
 
     def perform_create(self, serializer):
@@ -141,7 +168,7 @@ class CartItemViewSet(viewsets.ModelViewSet):
     - Quantity validation and stock checking
     - Concurrency control with database locking
     """
-    queryset = CartItem.objects.all()
+    queryset = CartItem.objects.select_related('product').only(*CART_ITEM_FIELDS)
     serializer_class = CartItemSerializer
     permission_classes = [IsCustomer | IsAdmin]
     
@@ -153,23 +180,12 @@ class CartItemViewSet(viewsets.ModelViewSet):
             QuerySet: Filtered cart items
         """
         if self.request.user.is_authenticated:
+            queryset = super().get_queryset()
             if self.request.user.is_admin:
-                return CartItem.objects.all()
-            return CartItem.objects.filter(cart__user=self.request.user)
+                return queryset
+            return queryset.filter(cart__user=self.request.user)
         return CartItem.objects.none()
 
-    def get_cart(self):
-        """
-        Get or create cart for current user.
-        
-        Returns:
-            Cart: User's cart instance
-        """
-        if self.request.user.is_authenticated:
-            cart, created = Cart.objects.get_or_create(user=self.request.user)
-            return cart
-        return None
-
     def perform_create(self, serializer):
         """
         Create cart item with stock reservation.
@@ -180,52 +196,23 @@ class CartItemViewSet(viewsets.ModelViewSet):
         - Cart creation if it doesn't exist
         - Handling existing cart items (quantity increase)
         
+        CartItemSerializer.create reserves the stock and either increments
+        the item already in the cart or inserts a new one.
+        
         Args:
             serializer: CartItemSerializer instance
             
         Raises:
-            ValidationError: If insufficient stock or user not authenticated
+            ValidationError: If insufficient stock is available
         """
-        with transaction.atomic():
-            # Lock product to prevent race conditions
-            product = serializer.validated_data['product']
-            locked_product = Product.objects.select_for_update().get(id=product.id)
-            
-            # Validate stock availability
-            quantity = serializer.validated_data['quantity']
-            if not locked_product.is_in_stock(quantity):
-                raise ValidationError(f"Insufficient stock. Only {locked_product.available_stock} available.")
-            
-            # Get or create cart
-            cart = self.get_cart()
-            if not cart:
-                raise ValidationError("User must be authenticated to add items to cart")
-            
-            # Check if item already exists in cart
-            existing_item = CartItem.objects.filter(cart=cart, product=locked_product).first()
-            if existing_item:
-                # Update existing item
-                new_quantity = existing_item.quantity + quantity
-                if not locked_product.is_in_stock(new_quantity):
-                    raise ValidationError(f"Insufficient stock. Only {locked_product.available_stock} available.")
-                
-                locked_product.reserve_stock(quantity)
-                existing_item.quantity = new_quantity
-                existing_item.save()
-                serializer.instance = existing_item
-            else:
-                # Create new item
-                locked_product.reserve_stock(quantity)
-                serializer.save(cart=cart)
+        serializer.save(user=self.request.user)
 
     def perform_update(self, serializer):
         """
         Update cart item with stock adjustment.
         
-        This method handles:
-        - Stock reservation for quantity increases
-        - Stock release for quantity decreases
-        - Atomic operations to prevent race conditions
+        CartItemSerializer.update reserves stock for quantity increases and
+        releases it for decreases with conditional UPDATEs.
         
         Args:
             serializer: CartItemSerializer instance
@@ -234,24 +221,6 @@ class CartItemViewSet(viewsets.ModelViewSet):
             ValidationError: If insufficient stock for quantity increase
         """
         with transaction.atomic():
-            instance = self.get_object()
-            product = instance.product
-            locked_product = Product.objects.select_for_update().get(id=product.id)
-            
-            old_quantity = instance.quantity
-            new_quantity = serializer.validated_data.get('quantity', old_quantity)
-            quantity_diff = new_quantity - old_quantity
-
-            if quantity_diff != 0:
-                if quantity_diff > 0:
-                    # Adding more items
-                    if not locked_product.is_in_stock(quantity_diff):
-                        raise ValidationError(f"Insufficient stock. Only {locked_product.available_stock} available.")
-                    locked_product.reserve_stock(quantity_diff)
-                else:
-                    # Removing items
-                    locked_product.release_stock(abs(quantity_diff))
-
             serializer.save()
 
     def perform_destroy(self, instance):
@@ -263,28 +232,35 @@ class CartItemViewSet(viewsets.ModelViewSet):
         - Uses atomic transaction for data integrity
         - Prevents stock inconsistencies
         
+        The release is a single conditional UPDATE, so no product row lock
+        is held while the item is deleted.
+        
         Args:
             instance: CartItem instance to delete
+            
+        Raises:
+            ValidationError: If less stock is reserved than the item holds
         """
         with transaction.atomic():
-            product = instance.product
-            locked_product = Product.objects.select_for_update().get(id=product.id)
-            
             # Release reserved stock
-            locked_product.release_stock(instance.quantity)
+            if not Product.try_release(instance.product_id, instance.quantity):
+                raise ValidationError('Cannot release more stock than reserved.')
             instance.delete()
 
 
 class OrderViewSet(viewsets.ModelViewSet):
-    queryset = Order.objects.all()
+    # OrderSerializer/OrderItemSerializer expose related rows by id only,
+    # so the items are prefetched without joining users or products.
+    queryset = Order.objects.prefetch_related('items')
     serializer_class = OrderSerializer
     permission_classes = [IsCustomer | IsAdmin]
 
     def get_queryset(self):
         if self.request.user.is_authenticated:
+            queryset = super().get_queryset()
             if self.request.user.is_admin:
-                return Order.objects.all()
-            return Order.objects.filter(user=self.request.user)
+                return queryset
+            return queryset.filter(user=self.request.user)
         return Order.objects.none()
 
     def perform_create(self, serializer):
@@ -344,48 +320,52 @@ class OrderViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Total quantity per product, so repeated lines are checked together
+        quantities = {}
+        for item in items:
+            quantities[item['product']] = quantities.get(item['product'], 0) + item['quantity']
+
         with transaction.atomic():
-            locked_products = {}
-            total_price = Decimal('0.00')
-
-            for item in items:
-                product = item['product']
-                quantity = item['quantity']
-
-                locked_product = Product.objects.select_for_update().get(id=product.id)
-                locked_products[locked_product.id] = locked_product
-
-                if not locked_product.is_in_stock(quantity):
-                    return Response(
-                        {
-                            'success': False,
-                            'message': 'Insufficient stock',
-                            'errors': {
-                                'product': locked_product.id,
-                                'available_stock': locked_product.available_stock,
-                                'requested_quantity': quantity,
-                            },
-                        },
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-
-                total_price += (locked_product.price * quantity)
+            # Lock every requested product in one query, in ascending id order
+            # so concurrent orders and checkouts cannot deadlock
+            locked_products = Product.lock_stock(quantities)
+
+            shortages = []
+            for product_id, quantity in quantities.items():
+                product = locked_products[product_id]
+                available_stock = product.stock_quantity - product.reserved_stock
+                if available_stock < quantity:
+                    shortages.append({
+                        'product': product_id,
+                        'available_stock': available_stock,
+                        'requested_quantity': quantity,
+                    })
+            if shortages:
+                return Response(
+                    {
+                        'success': False,
+                        'message': 'Insufficient stock',
+                        'errors': shortages,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
+            total_price = sum(
+                (locked_products[item['product']].price * item['quantity'] for item in items),
+                Decimal('0.00')
+            )
             order = Order.objects.create(user=request.user, total_price=total_price, status='pending')
 
-            for item in items:
-                locked_product = locked_products[item['product'].id]
-                quantity = item['quantity']
-
-                OrderItem.objects.create(
+            OrderItem.objects.bulk_create([
+                OrderItem(
                     order=order,
-                    product=locked_product,
-                    quantity=quantity,
-                    price_at_purchase=locked_product.price,
+                    product_id=item['product'],
+                    quantity=item['quantity'],
+                    price_at_purchase=locked_products[item['product']].price,
                 )
-
-                locked_product.stock_quantity = locked_product.stock_quantity - quantity
-                locked_product.save(update_fields=['stock_quantity'])
+                for item in items
+            ])
+            Product.bulk_deduct_stock(quantities)
 
             return Response(OrderSerializer(order).data, status=status.HTTP_201_CREATED)
 
@@ -397,7 +377,8 @@ class OrderItemViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         if self.request.user.is_authenticated:
+            queryset = super().get_queryset()
             if self.request.user.is_admin:
-                return OrderItem.objects.all()
-            return OrderItem.objects.filter(order__user=self.request.user)
+                return queryset
+            return queryset.filter(order__user=self.request.user)
         return OrderItem.objects.none()
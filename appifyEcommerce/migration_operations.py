@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+class CreateTrigramIndex(migrations.RunSQL):
+    """
+    GIN trigram index for icontains searches, created on PostgreSQL only.
+    
+    icontains compiles to UPPER(column::text) LIKE UPPER(%term%) on
+    PostgreSQL, so the index is built on that expression. Other databases
+    have no trigram support and are left unchanged.
+    """
+
+    def __init__(self, name, table, column):
+        self.name = name
+        self.table = table
+        self.column = column
+        super().__init__(
+            sql=[
+                'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+                f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+                f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)',
+            ],
+            reverse_sql=[f'DROP INDEX IF EXISTS {name}'],
+        )
+
+    def deconstruct(self):
+        return self.__class__.__qualname__, [], {'name': self.name, 'table': self.table, 'column': self.column}
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
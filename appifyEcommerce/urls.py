@@ -2,7 +2,6 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework import routers
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
-from drf_spectacular.openapi import AutoSchema
 
 from appifyEcommerce.api.viewsets import (
     ProductViewSet,
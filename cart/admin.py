@@ -6,13 +6,21 @@ from .models import Cart, CartItem
 class CartItemInline(AdminRoleMixin, admin.TabularInline):
     model = CartItem
     extra = 1
+    # A raw id input instead of a <select> listing every product per row
+    raw_id_fields = ('product',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('product')
 
 @admin.register(Cart)
 class CartAdmin(AdminRoleMixin, admin.ModelAdmin):
     list_display = ('user',)
+    list_select_related = ('user',)
     inlines = [CartItemInline]
 
 @admin.register(CartItem)
 class CartItemAdmin(AdminRoleMixin, admin.ModelAdmin):
     list_display = ('cart', 'product', 'quantity')
+    # Cart.__str__ includes the user, so join it along with the cart
+    list_select_related = ('cart__user', 'product')
 
@@ -1,9 +1,14 @@
 from rest_framework import status, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Max, Sum
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.views.decorators.http import condition
 from decimal import Decimal
+import hashlib
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 
@@ -15,6 +20,78 @@ from appifyEcommerce.api.serializers import CartSerializer, OrderSerializer
 User = get_user_model()
 
 
+CART_SUMMARY_TIMEOUT = 30
+
+
+def get_cart_version(user):
+    """
+    Fetch the values that identify the current state of a user's cart.
+    
+    Returns the cart id (None if the user has no cart), the item count and
+    the latest item and product modification times, in a single query.
+    """
+    version = Cart.objects.filter(user=user).aggregate(
+        cart_id=Max('id'),
+        items_count=Count('items'),
+        items_updated=Max('items__updated_at'),
+        products_updated=Max('items__product__updated_at'),
+    )
+    for key in ('items_updated', 'products_updated'):
+        if version[key] is not None:
+            version[key] = version[key].timestamp()
+    return version
+
+
+def cart_summary_etag(request):
+    """
+    ETag for a user's cart summary, derived from the cart version.
+    
+    The version is kept on the request so the view can reuse it for its
+    cache key without querying again.
+    """
+    request._cart_version = get_cart_version(request.user)
+    return hashlib.md5(
+        '{cart_id}:{items_count}:{items_updated}:{products_updated}'.format(**request._cart_version).encode()
+    ).hexdigest()
+
+
+def build_cart_summary(cart_id):
+    """Build the cart summary payload for a cart"""
+    rows = CartItem.objects.filter(cart_id=cart_id).values(
+        'id', 'quantity', 'product_id', 'product__name', 'product__price',
+    ).annotate(
+        available_stock=F('product__stock_quantity') - F('product__reserved_stock'),
+        item_total=ExpressionWrapper(
+            F('quantity') * F('product__price'),
+            output_field=DecimalField(max_digits=20, decimal_places=2),
+        ),
+    )
+    
+    items_data = [
+        {
+            'id': row['id'],
+            'product': {
+                'id': row['product_id'],
+                'name': row['product__name'],
+                'price': float(row['product__price']),
+                'available_stock': row['available_stock']
+            },
+            'quantity': row['quantity'],
+            'item_total': float(row['item_total']),
+            'in_stock': row['available_stock'] >= row['quantity']
+        }
+        for row in rows
+    ]
+    total_price = sum((row['item_total'] for row in rows), Decimal('0.00'))
+    
+    return {
+        'items': items_data,
+        'total_price': float(total_price),
+        'items_count': len(items_data),
+        'can_checkout': all(item['in_stock'] for item in items_data)
+    }
+
+
 @extend_schema(
     summary="Process Checkout",
     description="""
@@ -49,7 +126,6 @@ User = get_user_model()
         },
         400: OpenApiTypes.OBJECT,
         401: OpenApiTypes.OBJECT,
-        500: OpenApiTypes.OBJECT,
     },
     examples=[
         OpenApiExample(
@@ -87,7 +163,6 @@ def checkout(request):
         201: Order created successfully
         400: Cart empty or validation error
         401: User not authenticated
-        500: Server error during checkout
     """
     try:
         with transaction.atomic():
@@ -101,20 +176,25 @@ def checkout(request):
                     'errors': {'cart': 'Cart is empty'}
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            # Get cart items
-            cart_items = cart.items.all()
-            if not cart_items.exists():
+            # Lock the cart items so a concurrent update cannot change them
+            # between the total, the order items and the stock reduction;
+            # prices are read from the locked products below
+            cart_items = list(cart.items.select_for_update().only('id', 'quantity', 'product_id'))
+            if not cart_items:
                 return Response({
                     'success': False,
                     'message': 'Cart is empty',
                     'errors': {'cart': 'Cannot checkout with empty cart'}
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            # Calculate total price
-            total_price = Decimal('0.00')
-            for item in cart_items:
-                item_total = item.quantity * item.product.price
-                total_price += item_total
+            # Lock all products for stock reduction in one query, in ascending
+            # id order like place_order so the two cannot deadlock
+            locked_products = Product.lock_stock({cart_item.product_id for cart_item in cart_items})
+
+            # Calculate total price in the database
+            total_price = cart.items.aggregate(
+                total=Sum(F('quantity') * F('product__price'), output_field=DecimalField(max_digits=10, decimal_places=2))
+            )['total']
 
             # Create order
             order = Order.objects.create(
@@ -123,24 +203,25 @@ def checkout(request):
                 status='pending'
             )
 
-            # Create order items and reduce stock
-            for cart_item in cart_items:
-                # Lock product for stock reduction
-                product = Product.objects.select_for_update().get(id=cart_item.product.id)
-                
-                # Create order item
-                OrderItem.objects.create(
+            # Create order items in one INSERT
+            OrderItem.objects.bulk_create([
+                OrderItem(
                     order=order,
-                    product=cart_item.product,
+                    product_id=cart_item.product_id,
                     quantity=cart_item.quantity,
-                    price_at_purchase=cart_item.product.price
+                    price_at_purchase=locked_products[cart_item.product_id].price
                 )
-                
-                # Permanently reduce stock
-                product.reduce_stock(cart_item.quantity)
+                for cart_item in cart_items
+            ])
+
+            # Permanently reduce stock in one UPDATE
+            Product.bulk_reduce_stock({
+                cart_item.product_id: cart_item.quantity for cart_item in cart_items
+            })
 
             # Clear cart
-            cart_items.delete()
+            items_count = len(cart_items)
+            CartItem.objects.filter(cart=cart).delete()
 
             # Return order details
             order_serializer = OrderSerializer(order)
@@ -151,16 +232,18 @@ def checkout(request):
                 'data': {
                     'order': order_serializer.data,
                     'total_price': float(total_price),
-                    'items_count': cart_items.count()
+                    'items_count': items_count
                 }
             }, status=status.HTTP_201_CREATED)
 
-    except Exception as e:
+    except ValidationError as e:
+        # Raised when reserved stock no longer covers the cart; the
+        # transaction has already been rolled back
         return Response({
             'success': False,
             'message': 'Checkout failed',
-            'errors': {'detail': str(e)}
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            'errors': {'detail': e.messages}
+        }, status=status.HTTP_400_BAD_REQUEST)
 
 
 @extend_schema(
@@ -214,8 +297,8 @@ def checkout(request):
                 }
             }
         },
+        304: None,
         401: OpenApiTypes.OBJECT,
-        500: OpenApiTypes.OBJECT,
     },
     examples=[
         OpenApiExample(
@@ -248,6 +331,7 @@ def checkout(request):
 )
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
+@condition(etag_func=cart_summary_etag)
 def cart_summary(request):
     """
     Get cart summary with stock information.
@@ -260,47 +344,16 @@ def cart_summary(request):
     
     The stock information is real-time and helps users understand
     if all items in their cart are still available for purchase.
+    Clients that send the previous ETag in If-None-Match get a 304
+    until the cart or one of its products changes.
     
     Returns:
         200: Cart summary retrieved successfully
+        304: Cart summary unchanged since the given ETag
         401: User not authenticated
-        500: Server error during retrieval
     """
-    try:
-        cart = Cart.objects.get(user=request.user)
-        cart_items = cart.items.select_related('product').all()
-        
-        total_price = Decimal('0.00')
-        items_data = []
-        
-        for item in cart_items:
-            item_total = item.quantity * item.product.price
-            total_price += item_total
-            
-            items_data.append({
-                'id': item.id,
-                'product': {
-                    'id': item.product.id,
-                    'name': item.product.name,
-                    'price': float(item.product.price),
-                    'available_stock': item.product.available_stock
-                },
-                'quantity': item.quantity,
-                'item_total': float(item_total),
-                'in_stock': item.product.is_in_stock(item.quantity)
-            })
-        
-        return Response({
-            'success': True,
-            'data': {
-                'items': items_data,
-                'total_price': float(total_price),
-                'items_count': len(items_data),
-                'can_checkout': all(item['in_stock'] for item in items_data)
-            }
-        })
-        
-    except Cart.DoesNotExist:
+    version = request._cart_version
+    if version['cart_id'] is None:
         return Response({
             'success': True,
             'data': {
@@ -310,9 +363,17 @@ def cart_summary(request):
                 'can_checkout': False
             }
         })
-    except Exception as e:
-        return Response({
-            'success': False,
-            'message': 'Failed to get cart summary',
-            'errors': {'detail': str(e)}
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    # The key changes whenever an item or one of its products changes,
+    # so cached summaries never need explicit invalidation
+    cache_key = 'cartsum:{cart_id}:{items_count}:{items_updated}:{products_updated}'.format(**version)
+    data = cache.get_or_set(
+        cache_key,
+        lambda: build_cart_summary(version['cart_id']),
+        CART_SUMMARY_TIMEOUT
+    )
+    
+    return Response({
+        'success': True,
+        'data': data
+    })
@@ -1,21 +1,34 @@
 from django.contrib import admin
 from .models import Order, OrderItem
 from accounts.mixins import AdminRoleMixin
+from accounts.paginators import FasterAdminPaginator
 
 class OrderItemInline(AdminRoleMixin, admin.TabularInline):
     model = OrderItem
     extra = 1
+    # A raw id input instead of a <select> listing every product per row
+    raw_id_fields = ('product',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('product')
 
 @admin.register(Order)
 class OrderAdmin(AdminRoleMixin, admin.ModelAdmin):
     list_display = ('id', 'user', 'total_price', 'status', 'created_at')
+    list_select_related = ('user',)
     list_filter = ('status', 'created_at')
     search_fields = ('user__username', 'id')
     readonly_fields = ('created_at',)
     inlines = [OrderItemInline]
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
 @admin.register(OrderItem)
 class OrderItemAdmin(AdminRoleMixin, admin.ModelAdmin):
     list_display = ('id', 'order', 'product', 'quantity', 'price_at_purchase')
+    # Order.__str__ includes the user, so join it along with the order
+    list_select_related = ('order__user', 'product')
     list_filter = ('order__status',)
     search_fields = ('order__id', 'product__name')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
@@ -16,6 +16,13 @@ class Order(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            # Admin status filter, newest first within a status
+            models.Index(fields=['status', '-created_at']),
+        ]
+
     def __str__(self):
         return f"Order #{self.id} by {self.user}"
 
@@ -1,11 +1,25 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from accounts.mixins import AdminRoleMixin
+from accounts.paginators import FasterAdminPaginator
 from .models import Product
 
 
+class ProductChangeList(ChangeList):
+    """Changelist that leaves the description text out of its query"""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).defer('description')
+
+
 @admin.register(Product)
 class ProductAdmin(AdminRoleMixin, admin.ModelAdmin):
     list_display = ('name', 'price', 'stock_quantity')
     search_fields = ('name',)
+    ordering = ('-id',)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
+    def get_changelist(self, request, **kwargs):
+        return ProductChangeList
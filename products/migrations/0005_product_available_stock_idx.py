@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:34
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0004_product_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(django.db.models.expressions.CombinedExpression(models.F('stock_quantity'), '-', models.F('reserved_stock')), name='product_available_stock_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:34
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_product_available_stock_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='product',
+            options={},
+        ),
+    ]
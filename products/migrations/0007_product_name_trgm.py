@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from appifyEcommerce.migration_operations import CreateTrigramIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_remove_product_ordering'),
+    ]
+
+    operations = [
+        CreateTrigramIndex('product_name_trgm', 'products_product', 'name'),
+    ]
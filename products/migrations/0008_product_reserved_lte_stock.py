@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_product_name_trgm'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.CheckConstraint(condition=models.Q(('reserved_stock__lte', models.F('stock_quantity'))), name='product_reserved_lte_stock'),
+        ),
+    ]
@@ -1,5 +1,27 @@
 from django.db import models
+from django.db.models import Case, F, Q, When
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+# Columns needed while a product row is locked for a stock change
+STOCK_FIELDS = ('id', 'price', 'stock_quantity', 'reserved_stock')
+
+
+def _per_product(field, quantities):
+    """CASE expression subtracting each product's quantity from ``field``"""
+    return Case(
+        *[When(pk=pk, then=F(field) - quantity) for pk, quantity in quantities.items()],
+        default=F(field),
+        output_field=models.PositiveIntegerField(),
+    )
+
+
+class ProductQuerySet(models.QuerySet):
+    def in_stock(self, quantity=1):
+        """Products with at least ``quantity`` units available, filtered in SQL"""
+        return self.alias(
+            available=F('stock_quantity') - F('reserved_stock'),
+        ).filter(available__gte=quantity)
 
 
 class Product(models.Model):
@@ -8,9 +30,24 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     stock_quantity = models.PositiveIntegerField(default=0)
     reserved_stock = models.PositiveIntegerField(default=0)
+    # Bumped by every stock change, including queryset updates, so cached
+    # cart summaries can be keyed on it
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ProductQuerySet.as_manager()
 
     class Meta:
-        ordering = ['-id']
+        indexes = [
+            # Matches the expression ProductQuerySet.in_stock() filters on
+            models.Index(F('stock_quantity') - F('reserved_stock'), name='product_available_stock_idx'),
+        ]
+        constraints = [
+            # Backstop for every code path that writes stock columns
+            models.CheckConstraint(
+                condition=Q(reserved_stock__lte=F('stock_quantity')),
+                name='product_reserved_lte_stock',
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -22,28 +59,79 @@ class Product(models.Model):
 
     def reserve_stock(self, quantity):
         """Reserve stock for cart items"""
-        if quantity > self.available_stock:
+        if not Product.try_reserve(self.pk, quantity):
+            self.refresh_from_db(fields=['stock_quantity', 'reserved_stock'])
             raise ValidationError(f'Insufficient stock. Only {self.available_stock} available.')
         
         self.reserved_stock += quantity
-        self.save(update_fields=['reserved_stock'])
 
     def release_stock(self, quantity):
         """Release reserved stock back to available"""
-        if quantity > self.reserved_stock:
+        if not Product.try_release(self.pk, quantity):
             raise ValidationError('Cannot release more stock than reserved.')
         
         self.reserved_stock -= quantity
-        self.save(update_fields=['reserved_stock'])
 
     def reduce_stock(self, quantity):
         """Permanently reduce stock after order completion"""
-        if quantity > self.reserved_stock:
+        reduced = Product.objects.filter(pk=self.pk, reserved_stock__gte=quantity).update(
+            reserved_stock=F('reserved_stock') - quantity,
+            stock_quantity=F('stock_quantity') - quantity,
+            updated_at=timezone.now(),
+        )
+        if not reduced:
             raise ValidationError('Cannot reduce more stock than reserved.')
         
         self.reserved_stock -= quantity
         self.stock_quantity -= quantity
-        self.save(update_fields=['reserved_stock', 'stock_quantity'])
+
+    @classmethod
+    def try_reserve(cls, pk, quantity):
+        """Reserve stock in one UPDATE; False if not enough is available"""
+        return bool(cls.objects.filter(
+            pk=pk,
+            stock_quantity__gte=F('reserved_stock') + quantity,
+        ).update(reserved_stock=F('reserved_stock') + quantity, updated_at=timezone.now()))
+
+    @classmethod
+    def try_release(cls, pk, quantity):
+        """Release reserved stock in one UPDATE; False if not enough is reserved"""
+        return bool(cls.objects.filter(
+            pk=pk,
+            reserved_stock__gte=quantity,
+        ).update(reserved_stock=F('reserved_stock') - quantity, updated_at=timezone.now()))
+
+    @classmethod
+    def lock_stock(cls, ids):
+        """Lock products in id order and return their STOCK_FIELDS rows by id"""
+        rows = (
+            cls.objects.select_for_update().filter(pk__in=ids).order_by('id')
+            .values_list(*STOCK_FIELDS, named=True)
+        )
+        return {row.id: row for row in rows}
+
+    @classmethod
+    def bulk_deduct_stock(cls, quantities):
+        """Deduct a {product id: quantity} mapping from stock in one UPDATE"""
+        cls.objects.filter(pk__in=quantities).update(
+            stock_quantity=_per_product('stock_quantity', quantities),
+            updated_at=timezone.now(),
+        )
+
+    @classmethod
+    def bulk_reduce_stock(cls, quantities):
+        """Permanently reduce reserved stock for a {product id: quantity} mapping in one UPDATE"""
+        has_reserved = Q()
+        for pk, quantity in quantities.items():
+            has_reserved |= Q(pk=pk, reserved_stock__gte=quantity)
+
+        updated = cls.objects.filter(has_reserved).update(
+            reserved_stock=_per_product('reserved_stock', quantities),
+            stock_quantity=_per_product('stock_quantity', quantities),
+            updated_at=timezone.now(),
+        )
+        if updated != len(quantities):
+            raise ValidationError('Cannot reduce more stock than reserved.')
 
     def is_in_stock(self, quantity=1):
         """Check if product has sufficient stock"""
@@ -4,13 +4,34 @@ Test script for authentication API endpoints
 """
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive connection for every request in the script
+session = requests.Session()
+
 def test_endpoints():
     print("🔐 Testing Authentication API Endpoints")
     print("=" * 50)
     
+    # Admin registration does not depend on the customer flow below, so it
+    # is sent right away and its result is printed as step 5
+    admin_data = {
+        "username": "adminuser",
+        "email": "admin@example.com",
+        "password": "AdminPass123!",
+        "password_confirm": "AdminPass123!",
+        "role": "admin",
+        "first_name": "Admin",
+        "last_name": "User"
+    }
+    
+    # The admin request runs on its own thread, so it uses requests.post
+    # rather than the module-level session, which is not thread-safe
+    executor = ThreadPoolExecutor(max_workers=1)
+    admin_registration = executor.submit(requests.post, f"{BASE_URL}/auth/register/", json=admin_data)
+    
     # Test registration
     print("\n1. Testing Registration")
     register_data = {
@@ -23,7 +44,7 @@ def test_endpoints():
         "last_name": "User"
     }
     
-    response = requests.post(f"{BASE_URL}/auth/register/", json=register_data)
+    response = session.post(f"{BASE_URL}/auth/register/", json=register_data)
     print(f"Status: {response.status_code}")
     print(f"Response: {response.json()}")
     
@@ -42,7 +63,7 @@ def test_endpoints():
             "password": "TestPass123!"
         }
         
-        response = requests.post(f"{BASE_URL}/auth/login/", json=login_data)
+        response = session.post(f"{BASE_URL}/auth/login/", json=login_data)
         print(f"Status: {response.status_code}")
         print(f"Response: {response.json()}")
         
@@ -54,31 +75,22 @@ def test_endpoints():
             # Test user profile
             print("\n3. Testing User Profile")
             headers = {"Authorization": f"Bearer {access_token}"}
-            response = requests.get(f"{BASE_URL}/auth/user/", headers=headers)
+            response = session.get(f"{BASE_URL}/auth/user/", headers=headers)
             print(f"Status: {response.status_code}")
             print(f"Response: {response.json()}")
             
             # Test logout
             print("\n4. Testing Logout")
-            response = requests.post(f"{BASE_URL}/auth/logout/", 
-                                   json={"refresh": login_tokens['refresh']}, 
-                                   headers=headers)
+            response = session.post(f"{BASE_URL}/auth/logout/", 
+                                  json={"refresh": login_tokens['refresh']}, 
+                                  headers=headers)
             print(f"Status: {response.status_code}")
             print(f"Response: {response.json()}")
             
     # Test admin registration
     print("\n5. Testing Admin Registration")
-    admin_data = {
-        "username": "adminuser",
-        "email": "admin@example.com",
-        "password": "AdminPass123!",
-        "password_confirm": "AdminPass123!",
-        "role": "admin",
-        "first_name": "Admin",
-        "last_name": "User"
-    }
-    
-    response = requests.post(f"{BASE_URL}/auth/register/", json=admin_data)
+    response = admin_registration.result()
+    executor.shutdown()
     print(f"Status: {response.status_code}")
     print(f"Response: {response.json()}")
     
@@ -1,18 +1,20 @@
 #!/usr/bin/env python
 """
 Simple test for registration endpoint
+
+Requires httpx; the four probes are independent and are sent concurrently.
 """
-import requests
+import asyncio
+import httpx
 import json
 
 BASE_URL = "http://localhost:8000"
 
-def test_registration():
+async def test_registration():
     print("🔐 Testing Registration Endpoint")
     print("=" * 40)
     
     # Test valid registration
-    print("\n1. Valid Registration:")
     valid_data = {
         "username": "testuser",
         "email": "test@example.com",
@@ -21,12 +23,7 @@ def test_registration():
         "role": "customer"
     }
     
-    response = requests.post(f"{BASE_URL}/auth/register/", json=valid_data)
-    print(f"Status: {response.status_code}")
-    print(f"Content: {json.dumps(response.json(), indent=2)}")
-    
     # Test password mismatch
-    print("\n2. Password Mismatch:")
     invalid_data = {
         "username": "testuser2",
         "email": "test2@example.com",
@@ -35,12 +32,7 @@ def test_registration():
         "role": "customer"
     }
     
-    response = requests.post(f"{BASE_URL}/auth/register/", json=invalid_data)
-    print(f"Status: {response.status_code}")
-    print(f"Content: {json.dumps(response.json(), indent=2)}")
-    
     # Test invalid email
-    print("\n3. Invalid Email:")
     invalid_email_data = {
         "username": "testuser3",
         "email": "invalid-email",
@@ -49,12 +41,7 @@ def test_registration():
         "role": "customer"
     }
     
-    response = requests.post(f"{BASE_URL}/auth/register/", json=invalid_email_data)
-    print(f"Status: {response.status_code}")
-    print(f"Content: {json.dumps(response.json(), indent=2)}")
-    
     # Test weak password
-    print("\n4. Weak Password:")
     weak_password_data = {
         "username": "testuser4",
         "email": "test4@example.com",
@@ -63,9 +50,22 @@ def test_registration():
         "role": "customer"
     }
     
-    response = requests.post(f"{BASE_URL}/auth/register/", json=weak_password_data)
-    print(f"Status: {response.status_code}")
-    print(f"Content: {json.dumps(response.json(), indent=2)}")
+    probes = [
+        ("1. Valid Registration", valid_data),
+        ("2. Password Mismatch", invalid_data),
+        ("3. Invalid Email", invalid_email_data),
+        ("4. Weak Password", weak_password_data),
+    ]
+    
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        responses = await asyncio.gather(
+            *(client.post("/auth/register/", json=data) for _, data in probes)
+        )
+    
+    for (title, _), response in zip(probes, responses):
+        print(f"\n{title}:")
+        print(f"Status: {response.status_code}")
+        print(f"Content: {json.dumps(response.json(), indent=2)}")
     
     print("\n" + "=" * 40)
     print("📝 Registration Endpoint Summary:")
@@ -77,4 +77,4 @@ def test_registration():
     print("✅ Response format: success, message, content")
 
 if __name__ == "__main__":
-    test_registration()
+    asyncio.run(test_registration())
@@ -0,0 +1,27 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class FastHasherTestCase(TestCase):
+    """Base class for tests that create users; MD5 keeps hashing out of the run time"""
+
+
+class CustomerAPITestCase(FastHasherTestCase):
+    """Tests run against a cleared cache with an API client logged in as a customer"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        
+        self.customer_user = User.objects.create_user(
+            username='customer',
+            password='testpass123',
+            email='customer@test.com',
+            role='customer'
+        )
+        self.client.force_authenticate(user=self.customer_user)
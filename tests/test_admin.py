@@ -0,0 +1,82 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from accounts.paginators import FasterAdminPaginator
+from cart.models import Cart, CartItem
+from orders.models import Order, OrderItem
+from products.models import Product
+from tests.base import FastHasherTestCase
+
+User = get_user_model()
+
+
+class AdminChangelistQueryTestCase(FastHasherTestCase):
+    """Changelist query counts must not grow with the number of rows shown"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            password='testpass123',
+            email='admin@test.com',
+            role='admin'
+        )
+        self.client.force_login(self.admin_user)
+
+    def add_rows(self, count):
+        for index in range(count):
+            user = User.objects.create_user(username=f'customer{User.objects.count()}', password='testpass123')
+            product = Product.objects.create(name=f'Product {index}', price=10.00, stock_quantity=10)
+            order = Order.objects.create(user=user, total_price=10.00)
+            OrderItem.objects.create(order=order, product=product, quantity=1, price_at_purchase=10.00)
+            CartItem.objects.create(cart=Cart.objects.create(user=user), product=product, quantity=1)
+
+    def assertChangelistQueriesConstant(self, url):
+        self.add_rows(1)
+        with CaptureQueriesContext(connection) as few:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.add_rows(4)
+        with CaptureQueriesContext(connection) as many:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(len(few), len(many))
+
+    def test_order_changelist(self):
+        """Test that order users are joined into the changelist query"""
+        self.assertChangelistQueriesConstant('/admin/orders/order/')
+
+    def test_order_item_changelist(self):
+        """Test that orders, their users and products are joined into the changelist query"""
+        self.assertChangelistQueriesConstant('/admin/orders/orderitem/')
+
+    def test_cart_item_changelist(self):
+        """Test that carts, their users and products are joined into the changelist query"""
+        self.assertChangelistQueriesConstant('/admin/cart/cartitem/')
+
+    def test_paginator_counts_exactly_without_estimates(self):
+        """Test that the admin paginator falls back to COUNT(*) when no estimate is available"""
+        self.add_rows(3)
+        paginator = FasterAdminPaginator(Order.objects.order_by('id'), 2)
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(paginator.num_pages, 2)
+
+    def test_order_change_page_uses_raw_id_products(self):
+        """Test that order item rows do not each render a list of every product"""
+        self.add_rows(5)
+        order = Order.objects.first()
+        
+        response = self.client.get(f'/admin/orders/order/{order.pk}/change/')
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'vForeignKeyRawIdAdminField')
+        self.assertNotContains(response, '<select name="items-0-product"')
+
+    def test_product_changelist_defers_description(self):
+        """Test that the product changelist does not select descriptions"""
+        self.add_rows(2)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get('/admin/products/product/').status_code, 200)
+        product_selects = [query['sql'] for query in queries if 'FROM "products_product"' in query['sql']]
+        self.assertTrue(product_selects)
+        self.assertFalse(any('"description"' in sql for sql in product_selects))
+        
+        response = self.client.get(f'/admin/products/product/{Product.objects.first().pk}/change/')
+        self.assertContains(response, 'name="description"')
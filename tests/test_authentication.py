@@ -0,0 +1,95 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.authentication import user_cache_key
+from accounts.serializers import UserProfileSerializer
+from tests.base import CustomerAPITestCase
+
+User = get_user_model()
+
+
+@override_settings(CACHE_AUTHENTICATED_USERS=True)
+class CachedJWTAuthenticationTestCase(CustomerAPITestCase):
+    def setUp(self):
+        super().setUp()
+        # Authenticate with a real token so requests go through CachedJWTAuthentication
+        self.client.force_authenticate(user=None)
+        access = RefreshToken.for_user(self.customer_user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_user_is_cached_between_requests(self):
+        """Test that the second request does not reload the user"""
+        response = self.client.get('/auth/me/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(cache.get(user_cache_key(self.customer_user.pk)))
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/auth/me/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_saving_user_invalidates_cache(self):
+        """Test that updating the user drops the cached copy"""
+        self.client.get('/auth/me/')
+
+        self.customer_user.email = 'changed@test.com'
+        self.customer_user.save()
+        self.assertIsNone(cache.get(user_cache_key(self.customer_user.pk)))
+
+        response = self.client.get('/auth/me/')
+        self.assertEqual(response.data['data']['email'], 'changed@test.com')
+
+    def test_cached_user_is_still_checked(self):
+        """Test that a cache hit still rejects an inactive user"""
+        self.client.get('/auth/me/')
+        cached_user = cache.get(user_cache_key(self.customer_user.pk))
+        cached_user.is_active = False
+        cache.set(user_cache_key(self.customer_user.pk), cached_user)
+
+        response = self.client.get('/auth/me/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_validated_token_is_reused(self):
+        """Test that a repeated token skips signature validation"""
+        self.client.get('/auth/me/')
+        with mock.patch.object(JWTAuthentication, 'get_validated_token') as validate:
+            response = self.client.get('/auth/me/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        validate.assert_not_called()
+
+    def test_login_returns_profile_payload(self):
+        """Test that login returns the same user data as the profile endpoint"""
+        response = APIClient().post('/auth/login/', {
+            'username': 'customer',
+            'password': 'testpass123'
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['data']['user'],
+            dict(UserProfileSerializer(self.customer_user).data)
+        )
+
+    def test_role_checks_do_not_query(self):
+        """Test that role-gated endpoints only run their own queries"""
+        self.client.get('/api/cart/')
+
+        # Empty paginated cart list: only the COUNT, no user or role lookups
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/cart/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(CACHE_AUTHENTICATED_USERS=False)
+    def test_user_is_not_cached_without_shared_cache(self):
+        """Test that users are reloaded every request when the cache is per-process"""
+        self.client.get('/auth/me/')
+        self.assertIsNone(cache.get(user_cache_key(self.customer_user.pk)))
+        
+        User.objects.filter(pk=self.customer_user.pk).update(is_active=False)
+        response = self.client.get('/auth/me/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,69 @@
+from rest_framework import status
+from cart.models import Cart, CartItem
+from orders.models import Order, OrderItem
+from products.models import Product
+from tests.base import CustomerAPITestCase
+
+
+class ListQueryCountTestCase(CustomerAPITestCase):
+    """
+    Pin the query count of every list endpoint.
+    
+    Each paginated list costs a COUNT plus one query per level of nesting;
+    a serializer change that adds per-row lookups fails here first.
+    """
+
+    def setUp(self):
+        super().setUp()
+        
+        cart = Cart.objects.create(user=self.customer_user)
+        order = Order.objects.create(user=self.customer_user, total_price=0)
+        for index in range(5):
+            product = Product.objects.create(name=f'Product {index}', price=10.00, stock_quantity=10)
+            CartItem.objects.create(cart=cart, product=product, quantity=1)
+            OrderItem.objects.create(order=order, product=product, quantity=1, price_at_purchase=10.00)
+
+    def assertListQueries(self, url, num):
+        with self.assertNumQueries(num):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cart_list_does_not_query_per_item(self):
+        """Test that cart items and products are loaded with the carts"""
+        self.assertListQueries('/api/cart/', 3)
+
+    def test_cart_item_list_does_not_query_per_item(self):
+        """Test that products are joined into the cart item query"""
+        self.assertListQueries('/api/cart-items/', 2)
+
+    def test_order_list_does_not_query_per_item(self):
+        """Test that order items are loaded with the orders"""
+        self.assertListQueries('/api/orders/', 3)
+
+    def test_order_item_list_does_not_query_per_item(self):
+        """Test that order items are listed with a single query"""
+        self.assertListQueries('/api/order-items/', 2)
+
+    def test_product_list_does_not_query_per_item(self):
+        """Test that products are listed with a single query after the ETag check"""
+        self.assertListQueries('/api/products/', 3)
+
+    def test_product_list_honours_etag(self):
+        """Test that an unchanged product list answers 304 until a product changes"""
+        etag = self.client.get('/api/products/')['ETag']
+        
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/products/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        Product.objects.first().save()
+        response = self.client.get('/api/products/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_adding_existing_cart_item_skips_cart_lookup(self):
+        """Test that topping up a cart item does not load the cart"""
+        product = Product.objects.first()
+        # product lookup, stock UPDATE, item UPDATE and re-read, plus the savepoint
+        with self.assertNumQueries(6):
+            response = self.client.post('/api/cart-items/', {'product': product.id, 'quantity': 1})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
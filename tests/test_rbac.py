@@ -1,39 +1,32 @@
-from django.test import TestCase
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
 from products.models import Product
+from tests.base import FastHasherTestCase
 
 User = get_user_model()
 
 
-class RBACTestCase(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        
-        # Create users with different roles
-        self.admin_user = User.objects.create_user(
-            username='admin',
-            password='testpass123',
-            email='admin@test.com',
-            role='admin'
-        )
-        
-        self.customer_user = User.objects.create_user(
-            username='customer',
-            password='testpass123',
-            email='customer@test.com',
-            role='customer'
-        )
+class RBACTestCase(FastHasherTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Create users with different roles in one INSERT
+        cls.admin_user, cls.customer_user = User.bulk_register([
+            {'username': 'admin', 'password': 'testpass123', 'email': 'admin@test.com', 'role': 'admin'},
+            {'username': 'customer', 'password': 'testpass123', 'email': 'customer@test.com', 'role': 'customer'},
+        ])
         
         # Create test product
-        self.product = Product.objects.create(
+        cls.product = Product.objects.create(
             name='Test Product',
             description='Test Description',
             price=99.99,
             stock_quantity=10
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_unauthenticated_cannot_access_protected_endpoints(self):
         """Test that unauthenticated users cannot access protected endpoints"""
         # Try to access products list (should work for read)
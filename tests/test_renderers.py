@@ -0,0 +1,38 @@
+import datetime
+import decimal
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from appifyEcommerce.api.renderers import ORJSONParser, ORJSONRenderer
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    def test_output_matches_json_renderer(self):
+        """Test that orjson output is byte-for-byte the same as DRF's"""
+        data = {
+            'price': decimal.Decimal('19.99'),
+            'created_at': datetime.datetime(2026, 1, 1, 12, 30, tzinfo=datetime.timezone.utc),
+            'message': _('Order placed successfully'),
+            'items': [1, 2.5, None, True],
+            'name': 'Café  ',
+            1: 'non-string key',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indented_output_falls_back(self):
+        """Test that indented output is rendered like JSONRenderer"""
+        data = {'success': True}
+        self.assertEqual(
+            ORJSONRenderer().render(data, 'application/json; indent=4'),
+            JSONRenderer().render(data, 'application/json; indent=4')
+        )
+
+    def test_parser_rejects_invalid_json(self):
+        """Test that malformed request bodies raise ParseError"""
+        self.assertEqual(ORJSONParser().parse(BytesIO(b'{"quantity": 2}')), {'quantity': 2})
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b'{"quantity": }'))
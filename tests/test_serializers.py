@@ -0,0 +1,22 @@
+from django.test import SimpleTestCase
+
+from appifyEcommerce.api.serializers import CartItemSerializer, CartSerializer, ProductSerializer
+
+
+class CachedFieldsTestCase(SimpleTestCase):
+    def test_fields_are_built_once_per_class(self):
+        """Test that field introspection is cached on each serializer class separately"""
+        ProductSerializer().fields
+        CartItemSerializer().fields
+
+        self.assertIn('_cached_fields', ProductSerializer.__dict__)
+        self.assertIn('_cached_fields', CartItemSerializer.__dict__)
+        self.assertIsNot(ProductSerializer._cached_fields, CartItemSerializer._cached_fields)
+
+    def test_instances_get_their_own_fields(self):
+        """Test that binding fields to one serializer never leaks into another"""
+        first, second = CartSerializer(), CartSerializer()
+
+        self.assertIsNot(first.fields['items'], second.fields['items'])
+        self.assertIs(first.fields['items'].parent, first)
+        self.assertIs(second.fields['items'].parent, second)
@@ -0,0 +1,301 @@
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from rest_framework import status
+from products.models import Product
+from tests.base import CustomerAPITestCase
+
+
+class StockManagementTestCase(CustomerAPITestCase):
+    def setUp(self):
+        super().setUp()
+        
+        self.product = Product.objects.create(
+            name='Test Product',
+            description='Test Description',
+            price=10.00,
+            stock_quantity=10
+        )
+
+    def test_add_to_cart_reserves_stock_once(self):
+        """Test that adding an item reserves exactly the requested quantity"""
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['available_stock'], 8)
+        
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 2)
+
+    def test_add_existing_product_increases_quantity(self):
+        """Test that re-adding a product tops up the existing cart item"""
+        self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 3})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['quantity'], 5)
+
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 6})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 5)
+
+    def test_add_to_cart_retries_lost_insert_as_increment(self):
+        """Test that a concurrent first add of the same product tops up the other request's item"""
+        from cart.models import Cart, CartItem
+        
+        real_get_or_create = Cart.objects.get_or_create
+        
+        def get_or_create_after_other_request(**kwargs):
+            cart, created = real_get_or_create(**kwargs)
+            CartItem.objects.create(cart=cart, product=self.product, quantity=1)
+            return cart, created
+        
+        with mock.patch.object(Cart.objects, 'get_or_create', get_or_create_after_other_request):
+            response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['quantity'], 3)
+        self.assertEqual(CartItem.objects.filter(cart__user=self.customer_user).count(), 1)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 2)
+
+    def test_update_cart_item_adjusts_reservation(self):
+        """Test that changing the quantity reserves or releases the difference"""
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        item_id = response.data['id']
+        
+        response = self.client.patch(f'/api/cart-items/{item_id}/', {'quantity': 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 5)
+        
+        response = self.client.patch(f'/api/cart-items/{item_id}/', {'quantity': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 1)
+
+    def test_update_cart_item_rejects_insufficient_stock(self):
+        """Test that a quantity increase beyond available stock is rejected"""
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        item_id = response.data['id']
+        
+        response = self.client.patch(f'/api/cart-items/{item_id}/', {'quantity': 11})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 2)
+
+    def test_place_order_deducts_stock(self):
+        """Test that placing an order reduces stock for every item"""
+        other_product = Product.objects.create(name='Other Product', price=5.00, stock_quantity=3)
+        
+        response = self.client.post('/api/orders/place-order/', {
+            'items': [
+                {'product': self.product.id, 'quantity': 2},
+                {'product': other_product.id, 'quantity': 3},
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['total_price'], '35.00')
+        
+        self.product.refresh_from_db()
+        other_product.refresh_from_db()
+        self.assertEqual(self.product.stock_quantity, 8)
+        self.assertEqual(other_product.stock_quantity, 0)
+
+    def test_place_order_rejects_insufficient_stock(self):
+        """Test that an order exceeding available stock is rejected"""
+        response = self.client.post('/api/orders/place-order/', {
+            'items': [{'product': self.product.id, 'quantity': 11}]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock_quantity, 10)
+
+    def test_place_order_reports_every_shortage(self):
+        """Test that repeated lines are checked together and all shortages are listed"""
+        other_product = Product.objects.create(name='Other Product', price=5.00, stock_quantity=1)
+        
+        response = self.client.post('/api/orders/place-order/', {
+            'items': [
+                {'product': self.product.id, 'quantity': 6},
+                {'product': self.product.id, 'quantity': 6},
+                {'product': other_product.id, 'quantity': 2},
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            sorted((error['product'], error['requested_quantity']) for error in response.data['errors']),
+            sorted([(self.product.id, 12), (other_product.id, 2)]),
+        )
+
+    def test_place_order_rejects_unknown_product(self):
+        """Test that an order referencing a missing product is rejected"""
+        response = self.client.post('/api/orders/place-order/', {
+            'items': [
+                {'product': self.product.id, 'quantity': 1},
+                {'product': self.product.id + 100, 'quantity': 1},
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['items'], [
+            {},
+            {'product': [f'Invalid pk "{self.product.id + 100}" - object does not exist.']}
+        ])
+        
+        response = self.client.post('/api/orders/place-order/', {
+            'items': [
+                {'product': 'abc', 'quantity': 1},
+                {'product': True, 'quantity': 1},
+                {'product': 3.7, 'quantity': 1},
+            ]
+        }, format='json')
+        self.assertEqual(response.data['items'], [
+            {'product': ['Incorrect type. Expected pk value, received str.']},
+            {'product': ['Incorrect type. Expected pk value, received bool.']},
+            {'product': ['Incorrect type. Expected pk value, received float.']},
+        ])
+        
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock_quantity, 10)
+
+    def test_checkout_converts_cart_to_order(self):
+        """Test that checkout creates the order, reduces stock and clears the cart"""
+        from cart.models import CartItem
+        
+        other_product = Product.objects.create(name='Other Product', price=5.00, stock_quantity=3)
+        self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        self.client.post('/api/cart-items/', {'product': other_product.id, 'quantity': 3})
+        
+        response = self.client.post('/cart/checkout/')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['data']['total_price'], 35.0)
+        self.assertEqual(response.data['data']['items_count'], 2)
+        self.assertEqual(len(response.data['data']['order']['items']), 2)
+        
+        self.product.refresh_from_db()
+        other_product.refresh_from_db()
+        self.assertEqual((self.product.stock_quantity, self.product.reserved_stock), (8, 0))
+        self.assertEqual((other_product.stock_quantity, other_product.reserved_stock), (0, 0))
+        self.assertFalse(CartItem.objects.filter(cart__user=self.customer_user).exists())
+
+    def test_checkout_rejects_lost_reservation(self):
+        """Test that checkout fails cleanly when the reservation no longer covers the cart"""
+        from cart.models import CartItem
+        
+        self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        Product.objects.filter(pk=self.product.pk).update(reserved_stock=0)
+        
+        response = self.client.post('/cart/checkout/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(CartItem.objects.filter(cart__user=self.customer_user).count(), 1)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock_quantity, 10)
+
+    def test_cart_summary_reports_stock(self):
+        """Test that the cart summary lists items, totals and stock status"""
+        self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        
+        response = self.client.get('/cart/summary/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'], {
+            'items': [{
+                'id': response.data['data']['items'][0]['id'],
+                'product': {
+                    'id': self.product.id,
+                    'name': 'Test Product',
+                    'price': 10.0,
+                    'available_stock': 8
+                },
+                'quantity': 2,
+                'item_total': 20.0,
+                'in_stock': True
+            }],
+            'total_price': 20.0,
+            'items_count': 1,
+            'can_checkout': True
+        })
+
+    def test_cart_summary_reflects_changes(self):
+        """Test that a cached cart summary is rebuilt after the cart or stock changes"""
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        item_id = response.data['id']
+        self.client.get('/cart/summary/')
+        
+        self.client.patch(f'/api/cart-items/{item_id}/', {'quantity': 3})
+        response = self.client.get('/cart/summary/')
+        self.assertEqual(response.data['data']['items'][0]['quantity'], 3)
+        self.assertEqual(response.data['data']['items'][0]['product']['available_stock'], 7)
+        
+        # Stock reserved by another customer changes the product, not this cart
+        Product.objects.get(pk=self.product.pk).reserve_stock(7)
+        response = self.client.get('/cart/summary/')
+        self.assertEqual(response.data['data']['items'][0]['product']['available_stock'], 0)
+        self.assertFalse(response.data['data']['can_checkout'])
+        
+        self.client.delete(f'/api/cart-items/{item_id}/')
+        response = self.client.get('/cart/summary/')
+        self.assertEqual(response.data['data']['items'], [])
+
+    def test_cart_summary_honours_etag(self):
+        """Test that an unchanged cart summary answers 304 until the cart changes"""
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        item_id = response.data['id']
+        etag = self.client.get('/cart/summary/')['ETag']
+        
+        response = self.client.get('/cart/summary/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        self.client.patch(f'/api/cart-items/{item_id}/', {'quantity': 3})
+        response = self.client.get('/cart/summary/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['items'][0]['quantity'], 3)
+
+    def test_remove_cart_item_releases_stock(self):
+        """Test that deleting a cart item releases its reserved stock"""
+        response = self.client.post('/api/cart-items/', {'product': self.product.id, 'quantity': 2})
+        
+        response = self.client.delete(f"/api/cart-items/{response.data['id']}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 0)
+
+    def test_try_reserve_and_release_are_conditional(self):
+        """Test that conditional reservation never oversells or over-releases"""
+        self.assertTrue(Product.try_reserve(self.product.id, 10))
+        self.assertFalse(Product.try_reserve(self.product.id, 1))
+        self.assertFalse(Product.try_release(self.product.id, 11))
+        self.assertTrue(Product.try_release(self.product.id, 4))
+        
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 6)
+
+    def test_stock_methods_check_database_values(self):
+        """Test that stale instances cannot oversell, over-release or over-reduce"""
+        first = Product.objects.get(pk=self.product.pk)
+        second = Product.objects.get(pk=self.product.pk)
+        
+        first.reserve_stock(8)
+        with self.assertRaises(ValidationError):
+            second.reserve_stock(3)
+        self.assertEqual(second.available_stock, 2)
+        
+        first.reduce_stock(5)
+        with self.assertRaises(ValidationError):
+            second.release_stock(4)
+        
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 3)
+        self.assertEqual(self.product.stock_quantity, 5)
+
+    def test_in_stock_filters_on_available_stock(self):
+        """Test that in_stock() compares available, not total, stock"""
+        Product.objects.create(name='Sold Out', price=5.00, stock_quantity=4, reserved_stock=4)
+        self.product.reserve_stock(7)
+        
+        self.assertEqual(list(Product.objects.in_stock()), [self.product])
+        self.assertEqual(list(Product.objects.in_stock(4)), [])
+
+    def test_database_rejects_reserving_more_than_stock(self):
+        """Test that the check constraint blocks writes that bypass the stock methods"""
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Product.objects.filter(pk=self.product.pk).update(reserved_stock=11)
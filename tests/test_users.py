@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+
+from tests.base import FastHasherTestCase
+
+User = get_user_model()
+
+
+class BulkRegisterTestCase(FastHasherTestCase):
+    def test_bulk_register_creates_users(self):
+        """Test that bulk registration creates users with usable passwords"""
+        users = User.bulk_register([
+            {'username': 'admin', 'password': 'testpass123', 'email': 'admin@TEST.com', 'role': 'admin'},
+            {'username': 'customer', 'password': 'testpass123', 'email': 'customer@test.com'},
+        ])
+        self.assertEqual(len(users), 2)
+        
+        admin_user = User.objects.get(username='admin')
+        self.assertTrue(admin_user.check_password('testpass123'))
+        self.assertEqual(admin_user.email, 'admin@test.com')
+        self.assertTrue(admin_user.is_admin)
+        
+        customer_user = User.objects.get(username='customer')
+        self.assertTrue(customer_user.is_customer)